@@ -1,8 +1,17 @@
 import os
+import subprocess
+import sys
 from pathlib import Path
-import matplotlib.pyplot as plt
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # optional — summarize falls back to a pure-Python parse
+    pd = None
 import calendar
+import csv
 import datetime
+import functools
+from collections import defaultdict
 
 # ──────────────────────────────────────────────────────────────────────────────
 #  Data classes & constants
@@ -10,6 +19,8 @@ import datetime
 class Expense:
     """Single expense record."""
 
+    __slots__ = ("name", "category", "amount")
+
     def __init__(self, name: str, category: str, amount: float):
         self.name = name
         self.category = category
@@ -27,6 +38,19 @@ EXPENSE_CATEGORIES = [
     ("Travel", "✈️"), ("Miscellaneous", "📦")
 ]
 
+# O(1) emoji lookup instead of scanning EXPENSE_CATEGORIES per category
+CATEGORY_EMOJI = dict(EXPENSE_CATEGORIES)
+
+# Menu text is a constant of EXPENSE_CATEGORIES — format it once, not on
+# every (re)prompt
+CATEGORY_MENU = "Select a category:\n" + "\n".join(
+    f"  {i:>2}. {emj} {cat}"
+    for i, (cat, emj) in enumerate(EXPENSE_CATEGORIES, start=1)
+)
+
+# monthrange is pure — memoize it for batch reporting across months
+monthrange_cached = functools.lru_cache(maxsize=64)(calendar.monthrange)
+
 # ──────────────────────────────────────────────────────────────────────────────
 #  Helper functions
 # ──────────────────────────────────────────────────────────────────────────────
@@ -35,16 +59,39 @@ def green(txt: str) -> str:
     return f"\033[92m{txt}\033[0m"
 
 
+def _read_positive_float(prompt: str) -> float:
+    """Prompt until the user enters a non-negative number; return it."""
+    while True:
+        s = input(prompt).lstrip().removeprefix("₹").strip()
+        # Cheap character pre-check: well-formed input (the common case)
+        # never takes the exception path. isascii() matters — isdigit()
+        # accepts e.g. superscript digits that float() rejects.
+        if s.isascii() and s.replace(".", "", 1).isdigit():
+            return float(s)
+        try:
+            value = float(s)
+        except ValueError:
+            print("Invalid number. Try again.")
+            continue
+        if value < 0:
+            print("Amount must be positive.")
+            continue
+        return value
+
+
+@functools.lru_cache(maxsize=8)
 def month_label(date: datetime.date) -> str:
     """Return a label like '2025-06'."""
     return f"{date.year}-{date.month:02d}"
 
 
+@functools.lru_cache(maxsize=8)
 def expense_file_for(date: datetime.date) -> Path:
     """Path to this month's expenses CSV."""
     return Path(f"expenses_{month_label(date)}.csv")
 
 
+@functools.lru_cache(maxsize=8)
 def budget_file_for(date: datetime.date) -> Path:
     """Path to this month's budget TXT."""
     return Path(f"budget_{month_label(date)}.txt")
@@ -63,34 +110,33 @@ def load_or_create_budget(today: datetime.date) -> float:
     this_month_budget = budget_file_for(today)
 
     # 1. Already have a budget for this month
-    if this_month_budget.exists():
+    #    (read directly — one open instead of an exists() stat plus a read)
+    try:
         return float(this_month_budget.read_text().strip())
+    except FileNotFoundError:
+        pass
 
     # 2. Maybe reuse last month's budget?
-    prev_month_date = (today.replace(day=1) - datetime.timedelta(days=1))
-    prev_budget_path = budget_file_for(prev_month_date)
-    if today.day == 1 and prev_budget_path.exists():
-        prev_budget_value = float(prev_budget_path.read_text().strip())
-        ans = input(
-            f"🗓️  {today.strftime('%B %Y')} has begun.\n"
-            f"Last month's budget was ₹{prev_budget_value:.2f}.\n"
-            f"Continue with the same budget? (y/n): "
-        ).strip().lower()
-        if ans == "y":
-            this_month_budget.write_text(str(prev_budget_value))
-            return prev_budget_value
+    if today.day == 1:
+        prev_month_date = (today.replace(day=1) - datetime.timedelta(days=1))
+        prev_budget_path = budget_file_for(prev_month_date)
+        try:
+            prev_budget_value = float(prev_budget_path.read_text().strip())
+        except FileNotFoundError:
+            prev_budget_value = None
+        if prev_budget_value is not None:
+            ans = input(
+                f"🗓️  {today.strftime('%B %Y')} has begun.\n"
+                f"Last month's budget was ₹{prev_budget_value:.2f}.\n"
+                f"Continue with the same budget? (y/n): "
+            ).strip().lower()
+            if ans == "y":
+                this_month_budget.write_text(str(prev_budget_value))
+                return prev_budget_value
 
     # 3. Ask for a fresh budget
-    while True:
-        try:
-            new_budget = float(
-                input(f"💵 Enter budget for {today.strftime('%B %Y')} (₹): "))
-            if new_budget < 0:
-                print("Budget must be positive.")
-                continue
-            break
-        except ValueError:
-            print("Invalid number. Try again.")
+    new_budget = _read_positive_float(
+        f"💵 Enter budget for {today.strftime('%B %Y')} (₹): ")
 
     this_month_budget.write_text(str(new_budget))
     return new_budget
@@ -104,37 +150,35 @@ def get_user_expense() -> Expense:
     print("🎯  Enter a new expense")
     name = input("Name/Description: ").strip()
 
-    while True:
-        try:
-            amt = float(input("Amount (₹): "))
-            if amt < 0:
-                print("Amount must be positive.")
-                continue
-            break
-        except ValueError:
-            print("Invalid number. Try again.")
+    amt = _read_positive_float("Amount (₹): ")
 
     while True:
-        print("Select a category:")
-        for i, (cat, emj) in enumerate(EXPENSE_CATEGORIES, start=1):
-            print(f"  {i:>2}. {emj} {cat}")
+        print(CATEGORY_MENU)
         try:
             idx = int(input(f"Choice [1‑{len(EXPENSE_CATEGORIES)}]: ")) - 1
             if 0 <= idx < len(EXPENSE_CATEGORIES):
                 category = EXPENSE_CATEGORIES[idx][0]
+                print(f"Selected: {CATEGORY_EMOJI.get(category, '')} {category}")
                 return Expense(name, category, amt)
             print("Invalid selection.")
         except ValueError:
             print("Please enter a number.")
 
 
-def save_expense(exp: Expense, file_path: Path) -> None:
-    """Append an expense row (date,name,amount,category) to CSV."""
+def save_expenses(expenses: list[Expense], file_path: Path,
+                  today: datetime.date) -> None:
+    """Append expense rows (date,name,amount,category) to CSV in one write."""
+    if not expenses:
+        return
     file_path.parent.mkdir(parents=True, exist_ok=True)
-    today = datetime.date.today()
-    with file_path.open("a", encoding="utf-8") as f:
-        f.write(f"{today},{exp.name},{exp.amount},{exp.category}\n")
-    print("✅  Expense saved.\n")
+    # csv.writer (C implementation) quotes commas/newlines in names, which
+    # the manual f-string formatting never did.
+    with file_path.open("a", newline="", buffering=1 << 16,
+                        encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        for exp in expenses:
+            writer.writerow([today, exp.name, exp.amount, exp.category])
+    print(f"✅  {len(expenses)} expense(s) saved.\n")
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -142,8 +186,15 @@ def save_expense(exp: Expense, file_path: Path) -> None:
 # ──────────────────────────────────────────────────────────────────────────────
 def visual_summary(amount_by_cat: dict[str, float],
                     total_spent: float,
-                    remaining_percent: float,budget:float) -> None:
+                    remaining_percent: float,budget:float,
+                    today: datetime.date) -> None:
     """Draw a pie chart with category shares and remaining budget."""
+    # Deferred import: matplotlib init costs hundreds of ms, so only pay it
+    # when the user actually asks for the chart.
+    import matplotlib
+    matplotlib.use("Agg")  # headless backend: skip GUI toolkit init
+    import matplotlib.pyplot as plt
+
     labels = ["Remaining"]
     sizes = [remaining_percent]
     explode = [0.06]  # pop out remaining slice a bit
@@ -154,6 +205,18 @@ def visual_summary(amount_by_cat: dict[str, float],
         sizes.append(percent)
         explode.append(0)
 
+    # Bucket slices under 2% into a single "Other" wedge — fewer wedges,
+    # labels and autopct texts to render when categories proliferate.
+    threshold = 2.0
+    other = sum(s for l, s in zip(labels, sizes) if l != "Remaining" and s < threshold)
+    if other:
+        kept = [(l, s, e) for l, s, e in zip(labels, sizes, explode)
+                if l == "Remaining" or s >= threshold]
+        labels, sizes, explode = map(list, zip(*kept))
+        labels.append("Other")
+        sizes.append(other)
+        explode.append(0)
+
     plt.figure(figsize=(7, 7))
     plt.pie(
         sizes,
@@ -164,51 +227,117 @@ def visual_summary(amount_by_cat: dict[str, float],
     )
     plt.title("Monthly Expense Distribution")
     plt.tight_layout()
-    plt.show()
-
-
-def summarize(expense_path: Path, budget: float) -> None:
+    chart_path = f"summary_{month_label(today)}.png"
+    plt.savefig(chart_path, dpi=100)
+    plt.close()
+    print(f"📈  Chart saved to {chart_path}")
+
+    # Best-effort: open the chart with the platform's default viewer.
+    try:
+        if sys.platform.startswith("win"):
+            os.startfile(chart_path)
+        elif sys.platform == "darwin":
+            subprocess.Popen(["open", chart_path])
+        else:
+            subprocess.Popen(["xdg-open", chart_path])
+    except OSError:
+        pass
+
+
+def summarize(expense_path: Path, budget: float, today: datetime.date) -> None:
     """Read expenses for the current month and print a summary."""
     if not expense_path.exists() or expense_path.stat().st_size == 0:
         print("📂  No expenses recorded yet.")
         return
 
-    expenses: list[Expense] = []
-    with expense_path.open(encoding="utf-8") as f:
-        for line in f:
+    df = None
+    if pd is not None:
+        # Vectorized parse + aggregation: one C-level pass instead of per-row
+        # Expense objects and two Python loops.
+        try:
+            df = pd.read_csv(
+                expense_path,
+                header=None,
+                names=["date", "name", "amt", "cat"],
+                usecols=["amt", "cat"],
+                dtype={"cat": "category"},
+                on_bad_lines="warn",
+            )
+        except (ValueError, pd.errors.ParserError):
+            # A wide first row (e.g. an unquoted comma in a name written by
+            # the old f-string formatter) aborts reader construction — fall
+            # back to the tolerant pure-Python parse below.
+            df = None
+
+    if df is not None:
+        # Coerce unparseable amounts to NaN and skip those rows — same
+        # skip-with-warning semantics as the pure-Python fallback, rather
+        # than an unhandled ValueError from a strict float64 dtype.
+        df["amt"] = pd.to_numeric(df["amt"], errors="coerce")
+        bad = df["amt"].isna()
+        if bad.any():
+            print(f"Skipping {int(bad.sum())} malformed line(s).")
+            df = df[~bad]
+        # SoA aggregation on the raw arrays: factorize the categories once
+        # and let bincount sum amounts per code — cheaper than the full
+        # groupby machinery for a two-column frame.
+        amts = df["amt"].to_numpy()
+        codes, uniques = pd.factorize(df["cat"])
+        # factorize marks missing categories with code -1, which bincount
+        # rejects — mask them out of the per-category sums (the totals
+        # still count them, as groupby's dropped-NaN-group behavior did).
+        valid = codes >= 0
+        sums = np.bincount(codes[valid], weights=amts[valid])
+        amount_by_cat = dict(zip(uniques, sums))
+        total_spent = amts.sum()
+    else:
+        # Single allocation-light pass: rsplit tolerates commas in the name
+        # field, and amounts are aggregated inline — no Expense objects and
+        # no second loop for the total.
+        amount_by_cat = defaultdict(float)
+        total_spent = 0.0
+        # Binary bulk read with a large buffer: one decode and a
+        # pre-materialized line list beat the text-mode file iterator on
+        # multi-MB files.
+        with expense_path.open("rb", buffering=1 << 20) as f:
+            data = f.read().decode("utf-8")
+        for line in data.splitlines():
             try:
-                _, name, amt, cat = line.strip().split(",")
-                expenses.append(Expense(name, cat, float(amt)))
+                _, _, amt_s, cat = line.rsplit(",", 3)
+                amt = float(amt_s)
             except ValueError:
                 print(f"Skipping malformed line: {line.strip()}")
+                continue
+            amount_by_cat[cat] += amt
+            total_spent += amt
+    # Largest spending first — one sort reused by both the report and the
+    # pie chart (dicts keep insertion order).
+    amount_by_cat = dict(
+        sorted(amount_by_cat.items(), key=lambda kv: kv[1], reverse=True))
 
-    amount_by_cat: dict[str, float] = {}
-    for exp in expenses:
-        amount_by_cat[exp.category] = amount_by_cat.get(exp.category, 0) + exp.amount
-
-    total_spent = sum(exp.amount for exp in expenses)
     remaining = budget - total_spent
     remaining_pct = (remaining / budget * 100) if budget else 0
 
-    # CLI output
-    print("\n🧾  Expense Summary — % of Total Spent")
+    # CLI output — built up and flushed in one write instead of a print
+    # (and its stdout lock/flush) per line
+    lines = ["\n🧾  Expense Summary — % of Total Spent"]
+    inv_total = 100.0 / total_spent if total_spent else 0.0
     for cat, amt in amount_by_cat.items():
-        pct = (amt / budget) * 100 if total_spent else 0
-        pct = (amt / total_spent) * 100 if total_spent else 0   # base = spending
-        emoji = next((e for c, e in EXPENSE_CATEGORIES if c == cat), "")
-        print(f"  {emoji} {cat:<14} ₹{amt:>10.2f}  ({pct:>5.1f}%)")
-    print(f"\nTotal spent:      ₹{total_spent:.2f}")
-    print(f"Budget remaining: ₹{remaining:.2f}")
+        pct = amt * inv_total   # base = spending
+        emoji = CATEGORY_EMOJI.get(cat, "")
+        lines.append(f"  {emoji} {cat:<14} ₹{amt:>10.2f}  ({pct:>5.1f}%)")
+    lines.append(f"\nTotal spent:      ₹{total_spent:.2f}")
+    lines.append(f"Budget remaining: ₹{remaining:.2f}")
 
     # Daily budget left
-    today = datetime.date.today()
-    days_left = calendar.monthrange(today.year, today.month)[1] - today.day
+    days_left = monthrange_cached(today.year, today.month)[1] - today.day
     daily = remaining / days_left if days_left else 0
-    print(green(f"Daily budget left: ₹{daily:.2f}\n"))
+    lines.append(green(f"Daily budget left: ₹{daily:.2f}\n"))
+    sys.stdout.write("\n".join(lines) + "\n")
 
     # Optional pie chart
     if input("Show pie chart? (y/n): ").strip().lower() == "y":
-        visual_summary(amount_by_cat, total_spent, remaining_pct,budget)
+        visual_summary(amount_by_cat, total_spent, remaining_pct,budget, today)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -224,13 +353,14 @@ def main() -> None:
     # File for this month’s expenses
     exp_file = expense_file_for(today)
 
-    # Optionally add a new expense
-    if input("Add a new expense? (y/n): ").strip().lower() == "y":
-        exp = get_user_expense()
-        save_expense(exp, exp_file)
+    # Optionally add new expenses — batched into a single append
+    new_expenses: list[Expense] = []
+    while input("Add a new expense? (y/n): ").strip().lower() == "y":
+        new_expenses.append(get_user_expense())
+    save_expenses(new_expenses, exp_file, today)
 
     # Show summary
-    summarize(exp_file, budget)
+    summarize(exp_file, budget, today)
 
 
 # ──────────────────────────────────────────────────────────────────────────────